@@ -1,17 +1,30 @@
 import ast
+import functools
+import hashlib
+import json
 import logging
+import os
 import shutil
+import stat
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # libyaml is not available
+    from yaml import SafeDumper as _Dumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
 ROOT_DIR = Path(__file__).parent.parent
 PACKAGE_NAME = "clabe"
 SRC_DIR = ROOT_DIR / "src" / PACKAGE_NAME
 DOCS_DIR = ROOT_DIR / "docs"
 API_DIR = DOCS_DIR / "api"
 MKDOCS_YML = ROOT_DIR / "mkdocs.yml"
+COPY_CACHE = DOCS_DIR / ".copy-cache.json"
 API_LABEL = "API Reference"
 INCLUDE_PRIVATE_MODULES = False
 
@@ -19,140 +32,262 @@ TO_COPY = ["examples", "LICENSE"]
 log = logging.getLogger("mkdocs")
 
 
-def discover_python_modules(package_root: Path, include_private: bool = False) -> List[str]:
-    modules = []
+def _write_if_changed(path: Path, content: str) -> bool:
+    """
+    Writes content to path only if it differs from what is already on disk.
 
-    def _find_modules(current_path: Path, prefix: str = "") -> None:
-        if not current_path.exists() or not current_path.is_dir():
-            return
+    Leaving unchanged files untouched preserves their mtime, which lets mkdocs skip re-reading them.
+
+    Returns True if the file was written.
+    """
+    new_bytes = content.encode("utf-8")
+    try:
+        old_bytes: Optional[bytes] = path.read_bytes()
+    except FileNotFoundError:
+        old_bytes = None
+    if old_bytes == new_bytes:
+        return False
+    path.write_bytes(new_bytes)
+    return True
+
+
+def _tree_digest(root: Path) -> str:
+    """
+    Computes a cheap fingerprint of a file or directory tree from (relpath, size, mtime_ns) tuples.
+    """
+    entries: List[Tuple[str, int, int]] = []
+
+    def _scan(current: str) -> None:
+        with os.scandir(current) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    _scan(entry.path)
+                else:
+                    st = entry.stat()
+                    entries.append((os.path.relpath(entry.path, root), st.st_size, st.st_mtime_ns))
+
+    if root.is_dir():
+        _scan(os.fspath(root))
+    else:
+        st = root.stat()
+        entries.append((root.name, st.st_size, st.st_mtime_ns))
+    return hashlib.sha256(repr(sorted(entries)).encode("utf-8")).hexdigest()
+
+
+def _is_stale(src: os.DirEntry, dest: str) -> bool:
+    """
+    Returns True if dest is missing or differs from src in size or modification time.
+    """
+    try:
+        dest_stat = os.stat(dest)
+    except FileNotFoundError:
+        return True
+    src_stat = src.stat()
+    return src_stat.st_size != dest_stat.st_size or src_stat.st_mtime_ns != dest_stat.st_mtime_ns
 
-        for item in current_path.iterdir():
-            if not item.is_dir():
-                continue
-            if not (item / "__init__.py").exists():
-                continue
 
-            if item.name.startswith("_") and not include_private:
+def _sync_tree(src: str, dest: str) -> int:
+    """
+    Mirrors the src directory into dest, copying only files that changed and removing files no longer in src.
+
+    Files are copied with shutil.copy2 so their mtime is preserved and the next sync can detect them as unchanged.
+
+    Returns the number of files copied.
+    """
+    os.makedirs(dest, exist_ok=True)
+    copied = 0
+    seen = set()
+    with os.scandir(src) as it:
+        for entry in it:
+            seen.add(entry.name)
+            target = os.path.join(dest, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                if os.path.isfile(target):
+                    os.remove(target)
+                copied += _sync_tree(entry.path, target)
+            elif _is_stale(entry, target):
+                if os.path.isdir(target):
+                    shutil.rmtree(target)
+                shutil.copy2(entry.path, target)
+                copied += 1
+
+    with os.scandir(dest) as it:
+        for entry in it:
+            if entry.name in seen:
                 continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.remove(entry.path)
+    return copied
 
-            module_name = f"{prefix}{item.name}" if prefix else item.name
-            modules.append(module_name)
 
-            # Recursively search subdirectories for nested modules
-            _find_modules(item, f"{module_name}.")
+@functools.lru_cache(maxsize=64)
+def _scan_dir(path: str, mtime_ns: int) -> Tuple[Tuple[str, bool, bool], ...]:
+    """
+    Lists a directory as (name, is_file, is_dir) tuples.
 
-    _find_modules(package_root)
-    return sorted(modules)
+    The directory's mtime is part of the cache key, so the listing is reused until an entry is added, removed or renamed.
+    """
+    with os.scandir(path) as it:
+        return tuple(sorted((e.name, e.is_file(follow_symlinks=False), e.is_dir(follow_symlinks=False)) for e in it))
 
 
-def discover_module_files(module_path: Path, include_private: bool = False) -> List[str]:
-    files = []
+def _list_dir(path: str) -> Tuple[Tuple[str, bool, bool], ...]:
+    """
+    Returns the cached listing of path, or an empty listing if it is not a directory.
+    """
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return ()
+    if not stat.S_ISDIR(st.st_mode):
+        return ()
+    return _scan_dir(path, st.st_mtime_ns)
 
-    def _find_files(current_path: Path, prefix: str = "") -> None:
-        if not current_path.exists() or not current_path.is_dir():
-            return
 
-        for item in current_path.iterdir():
-            if item.is_file() and item.suffix == ".py":
-                if item.name.startswith("_") and not include_private:
-                    continue
-                file_name = f"{prefix}{item.stem}" if prefix else item.stem
-                files.append(file_name)
-            elif item.is_dir() and not item.name.startswith("__"):
-                if item.name.startswith("_") and not include_private:
+def discover_api_modules(package_root: Path, include_private: bool = False) -> Dict[str, List[str]]:
+    """
+    Walks the package tree once, mapping each sub-package to the python files documented under it.
+
+    Files are listed with dotted paths relative to their module, including files in nested directories.
+    """
+    modules: Dict[str, List[str]] = {}
+
+    def _walk(current_path: str, module_prefix: Optional[str]) -> List[str]:
+        files: List[str] = []
+        for name, is_file, is_dir in _list_dir(current_path):
+            if is_file:
+                # Cheap name checks first; most entries are rejected here
+                if name.endswith(".py") and (include_private or name[0] != "_"):
+                    files.append(name[:-3])
+            elif is_dir and not name.startswith("__"):
+                if name.startswith("_") and not include_private:
                     continue
-                # Recursively search subdirectories
-                _find_files(item, f"{prefix}{item.name}." if prefix else f"{item.name}.")
+                item_path = os.path.join(current_path, name)
+                # Only packages reachable through other packages are documented as modules
+                module_name: Optional[str] = None
+                if module_prefix is not None and any(n == "__init__.py" and f for n, f, _ in _list_dir(item_path)):
+                    module_name = f"{module_prefix}{name}"
+                sub_files = _walk(item_path, f"{module_name}." if module_name else None)
+                if module_name:
+                    modules[module_name] = sorted(sub_files)
+                files.extend(f"{name}.{sub_file}" for sub_file in sub_files)
+        return files
 
-    _find_files(module_path)
-    return sorted(files)
+    _walk(os.fspath(package_root), "")
+    return dict(sorted(modules.items()))
 
 
 def generate_api_structure() -> Dict[str, List[Dict[str, str]]]:
     api_structure: Dict[str, List[Dict[str, str]]] = {}
-    modules = discover_python_modules(SRC_DIR, INCLUDE_PRIVATE_MODULES)
+    modules = discover_api_modules(SRC_DIR, INCLUDE_PRIVATE_MODULES)
 
     API_DIR.mkdir(parents=True, exist_ok=True)
 
-    for item in SRC_DIR.iterdir():
-        if item.is_file() and item.suffix == ".py":
-            if item.name.startswith("_") and not INCLUDE_PRIVATE_MODULES:
-                continue
-            file_name = item.stem.replace("-", "_").replace(" ", "_")
-            safe_file_name = item.stem.replace(".", "_")
-            api_structure[file_name] = [{file_name: f"api/{safe_file_name}.md"}]
+    top_level_files = [
+        name
+        for name, is_file, _ in _list_dir(os.fspath(SRC_DIR))
+        if name.endswith(".py") and (INCLUDE_PRIVATE_MODULES or name[0] != "_") and is_file
+    ]
 
-            with open(DOCS_DIR / f"api/{safe_file_name}.md", "w") as f:
-                f.write(f"# {file_name}\n\n")
-                f.write(f"::: {PACKAGE_NAME}.{file_name}\n")
+    for name in top_level_files:
+        stem = name[:-3]
+        file_name = stem.replace("-", "_").replace(" ", "_")
+        safe_file_name = stem.replace(".", "_")
+        api_structure[file_name] = [{file_name: f"api/{safe_file_name}.md"}]
 
-    for module_name in modules:
-        module_structure: List[Dict[str, str]] = []
-        module_path = SRC_DIR / module_name.replace(".", "/")
+        _write_if_changed(API_DIR / f"{safe_file_name}.md", f"# {file_name}\n\n::: {PACKAGE_NAME}.{file_name}\n")
 
-        # Add the module's __init__.py as the main module entry
+    for module_name, module_files in modules.items():
         safe_module_name = module_name.replace(".", "_")
-        module_structure.append({module_name: f"api/{safe_module_name}/{safe_module_name}.md"})
-
-        module_files = discover_module_files(module_path, INCLUDE_PRIVATE_MODULES)
-        for file_name in module_files:
-            safe_file_name = file_name.replace(".", "_")
-            module_structure.append({file_name: f"api/{safe_module_name}/{safe_file_name}.md"})
+        module_dir = API_DIR / safe_module_name
+        module_dir.mkdir(exist_ok=True)
 
-        (API_DIR / safe_module_name).mkdir(parents=True, exist_ok=True)
-
-        with open(DOCS_DIR / f"api/{safe_module_name}/{safe_module_name}.md", "w") as f:
-            f.write(f"# {module_name}\n\n")
-            f.write(f"::: {PACKAGE_NAME}.{module_name}\n")
+        # Add the module's __init__.py as the main module entry
+        module_structure: List[Dict[str, str]] = [{module_name: f"api/{safe_module_name}/{safe_module_name}.md"}]
+        _write_if_changed(
+            module_dir / f"{safe_module_name}.md",
+            f"# {module_name}\n\n::: {PACKAGE_NAME}.{module_name}\n",
+        )
 
         for file_name in module_files:
             safe_file_name = file_name.replace(".", "_")
-            with open(DOCS_DIR / f"api/{safe_module_name}/{safe_file_name}.md", "w") as f:
-                f.write(f"# {module_name}.{file_name}\n\n")
-                f.write(f"::: {PACKAGE_NAME}.{module_name}.{file_name}\n")
+            module_structure.append({file_name: f"api/{safe_module_name}/{safe_file_name}.md"})
+            _write_if_changed(
+                module_dir / f"{safe_file_name}.md",
+                f"# {module_name}.{file_name}\n\n::: {PACKAGE_NAME}.{module_name}.{file_name}\n",
+            )
 
         api_structure[module_name] = module_structure
     return api_structure
 
 
 def update_mkdocs_yml(api_structure: Dict[str, List[Dict[str, str]]]) -> None:
-    with open(MKDOCS_YML, "r") as f:
-        config: Dict[str, Any] = yaml.safe_load(f)
+    current = MKDOCS_YML.read_text(encoding="utf-8")
+    config: Dict[str, Any] = yaml.load(current, Loader=_Loader)
 
     nav: List[Union[str, Dict[str, Any]]] = config.get("nav", [])
 
-    for entry in nav:
-        if isinstance(entry, dict) and API_LABEL in entry:
-            api_ref: List[Union[str, Dict[str, List[Dict[str, str]]]]] = []
-            for module_name, module_content in api_structure.items():
-                display_name = module_name.replace("_", " ").title()
-                api_ref.append({display_name: module_content})
+    api_ref: List[Union[str, Dict[str, List[Dict[str, str]]]]] = []
+    for module_name, module_content in api_structure.items():
+        display_name = module_name.replace("_", " ").title()
+        api_ref.append({display_name: module_content})
 
+    changed = False
+    for entry in nav:
+        if isinstance(entry, dict) and API_LABEL in entry and entry[API_LABEL] != api_ref:
             entry[API_LABEL] = api_ref
+            changed = True
 
-    with open(MKDOCS_YML, "w") as f:
-        yaml.dump(config, f, sort_keys=False, default_flow_style=False)
+    # Skip re-serializing the whole config when the API reference is already up to date
+    if changed:
+        _write_if_changed(MKDOCS_YML, yaml.dump(config, Dumper=_Dumper, sort_keys=False, default_flow_style=False))
 
 
 def copy_assets() -> None:
+    try:
+        digests: Dict[str, str] = json.loads(COPY_CACHE.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        digests = {}
+
     for file_or_dir in TO_COPY:
         src: Path = ROOT_DIR / file_or_dir
         dest: Path = DOCS_DIR / file_or_dir
 
         if src.exists():
+            digest = _tree_digest(src)
+            if dest.exists() and digests.get(file_or_dir) == digest:
+                log.info("%s is up to date, skipping.", file_or_dir)
+                continue
+
             log.info("Copying %s to docs...", file_or_dir)
 
             if src.is_file():
-                log.info("Copying file %s to %s", src, dest)
-                shutil.copy(src, dest)
+                src_stat = src.stat()
+                try:
+                    dest_stat: Optional[os.stat_result] = dest.stat()
+                except FileNotFoundError:
+                    dest_stat = None
+                if (
+                    dest_stat is None
+                    or src_stat.st_size != dest_stat.st_size
+                    or src_stat.st_mtime_ns != dest_stat.st_mtime_ns
+                ):
+                    log.info("Copying file %s to %s", src, dest)
+                    shutil.copy2(src, dest)
             else:
-                if dest.exists():
-                    shutil.rmtree(dest)
-                shutil.copytree(src, dest)
+                if dest.is_file():
+                    dest.unlink()
+                copied = _sync_tree(os.fspath(src), os.fspath(dest))
+                log.info("%d file(s) updated in %s", copied, dest)
+            digests[file_or_dir] = digest
             log.info("%s copied successfully.", file_or_dir)
         else:
             log.warning("Source: %s not found, skipping.", file_or_dir)
 
+    _write_if_changed(COPY_CACHE, json.dumps(digests, indent=2, sort_keys=True))
+
 
 def find_service_settings_classes(src_dir: Path) -> List[Tuple[str, Optional[str]]]:  # noqa: C901
     """
@@ -164,8 +299,7 @@ def find_service_settings_classes(src_dir: Path) -> List[Tuple[str, Optional[str
 
     for py_file in src_dir.rglob("*.py"):
         try:
-            with open(py_file, "r", encoding="utf-8") as f:
-                tree = ast.parse(f.read(), filename=str(py_file))
+            tree = ast.parse(py_file.read_bytes(), filename=str(py_file))
 
             for node in ast.walk(tree):
                 if isinstance(node, ast.ClassDef):
@@ -236,8 +370,7 @@ def generate_service_settings_table() -> None:
     articles_dir = DOCS_DIR / "articles"
     articles_dir.mkdir(exist_ok=True)
     output_path = articles_dir / "service_settings.md"
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(content))
+    _write_if_changed(output_path, "\n".join(content))
 
     log.info("Service settings documentation written to %s", output_path)
 
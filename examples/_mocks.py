@@ -1,6 +1,9 @@
 import datetime
+import functools
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any, Dict, Literal, Optional, Union
 
 import git
@@ -76,25 +79,43 @@ class DemoAindDataSchemaSessionDataMapper(DataMapper[MockAindDataSchemaSession])
         self._mapped = MockAindDataSchemaSession(
             computer_name=self.rig_model.computer_name, repository=self.repository, task_name=self.task_model.name
         )
-        print("#" * 50)
-        print("THIS IS MAPPED DATA!")
-        print("#" * 50)
-        print(self._mapped)
+        logger.info("\n%s\nTHIS IS MAPPED DATA!\n%s\n%s", "#" * 50, "#" * 50, self._mapped)
         return self._mapped
 
 
+_SUBJECT_PLACEHOLDER = "__SUBJECT__"
+
+
+@functools.cache
+def _fake_trainer_state_json() -> bytes:
+    return mock_trainer_state.model_dump_json(indent=2).encode("utf-8")
+
+
 def create_fake_subjects():
     subjects = ["00000", "123456"]
+    trainer_state = _fake_trainer_state_json()
+    # Validate and serialize the task once; subject ids are plain digits so no JSON escaping is needed
+    task_template = MockTask(task_parameters={"subject": _SUBJECT_PLACEHOLDER}).model_dump_json(indent=2)
+    files: list[tuple[Path, bytes]] = []
+    subjects_dir = Path(LIB_CONFIG) / "Subjects"
+    subjects_dir.mkdir(parents=True, exist_ok=True)
     for subject in subjects:
-        os.makedirs(f"{LIB_CONFIG}/Subjects/{subject}", exist_ok=True)
-        with open(f"{LIB_CONFIG}/Subjects/{subject}/task.json", "w", encoding="utf-8") as f:
-            f.write(MockTask(task_parameters={"subject": subject}).model_dump_json(indent=2))
-        with open(f"{LIB_CONFIG}/Subjects/{subject}/trainer_state.json", "w", encoding="utf-8") as f:
-            f.write(mock_trainer_state.model_dump_json(indent=2))
+        subject_dir = subjects_dir / subject
+        subject_dir.mkdir(exist_ok=True)
+        task = task_template.replace(_SUBJECT_PLACEHOLDER, subject).encode("utf-8")
+        files.append((subject_dir / "task.json", task))
+        files.append((subject_dir / "trainer_state.json", trainer_state))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda f: f[0].write_bytes(f[1]), files))
+
+
+@functools.cache
+def _fake_rig_json() -> bytes:
+    return RigModel(data_directory=r"./local/data", computer_name="mock_pc").model_dump_json(indent=2).encode("utf-8")
 
 
 def create_fake_rig():
-    computer_name = os.getenv("COMPUTERNAME")
-    os.makedirs(_dir := f"{LIB_CONFIG}/Rig/{computer_name}", exist_ok=True)
-    with open(f"{_dir}/rig1.json", "w", encoding="utf-8") as f:
-        f.write(RigModel(data_directory=r"./local/data", computer_name="mock_pc").model_dump_json(indent=2))
+    rig_dir = Path(LIB_CONFIG) / "Rig" / str(os.getenv("COMPUTERNAME"))
+    rig_dir.mkdir(parents=True, exist_ok=True)
+    (rig_dir / "rig1.json").write_bytes(_fake_rig_json())
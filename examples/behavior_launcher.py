@@ -1,26 +1,13 @@
 import asyncio
+import functools
 import logging
 from enum import Enum
 from pathlib import Path
 from typing import Literal, Optional
 
-from _mocks import (
-    LIB_CONFIG,
-    DemoAindDataSchemaSessionDataMapper,
-    MockTask,
-    RigModel,
-    Session,
-    create_fake_rig,
-    create_fake_subjects,
-)
 from pydantic import BaseModel, Field
-from pydantic_settings import CliApp
 
-from clabe import resource_monitor
-from clabe.apps import CurriculumApp, CurriculumSettings, PythonScriptApp
-from clabe.cache_manager import CacheManager
 from clabe.launcher import Launcher, LauncherCliArgs, experiment
-from clabe.pickers import DefaultBehaviorPicker, DefaultBehaviorPickerSettings
 from clabe.runnable import runnable
 from clabe.ui import (
     AcknowledgeRequest,
@@ -80,6 +67,22 @@ class SessionConfig(BaseModel):
 @experiment()
 async def demo_experiment(launcher: Launcher) -> None:
     """Demo experiment showcasing CLABE functionality."""
+    # Heavier dependencies are imported here rather than at module level so that
+    # discovering the experiments in this file (e.g. ``clabe run``) stays fast.
+    from _mocks import (
+        LIB_CONFIG,
+        DemoAindDataSchemaSessionDataMapper,
+        MockTask,
+        RigModel,
+        Session,
+        create_fake_rig,
+        create_fake_subjects,
+    )
+
+    from clabe import resource_monitor
+    from clabe.apps import CurriculumApp, CurriculumSettings, PythonScriptApp
+    from clabe.pickers import DefaultBehaviorPicker, DefaultBehaviorPickerSettings
+
     # Seed the mock rig/subjects/cache here so the demo also works when launched
     # via ``clabe run``/``clabe serve`` (which call this function but not main()).
     create_fake_subjects()
@@ -192,10 +195,11 @@ async def demo_experiment(launcher: Launcher) -> None:
     # ----------------------------------------------------------------------
 
     notify("Running the behavior and physiology apps…", MessageLevel.INFO)
-    app_1_result, app_2_result = await asyncio.gather(
-        runnable(app_1.run_async, name="Running Behavior App")(),
-        runnable(app_2.run_async, name="Running Physiology App")(),
-    )
+    # A TaskGroup cancels the sibling app as soon as one of them fails.
+    async with asyncio.TaskGroup() as tg:
+        app_1_task = tg.create_task(runnable(app_1.run_async, name="Running Behavior App")())
+        app_2_task = tg.create_task(runnable(app_2.run_async, name="Running Physiology App")())
+    app_1_result, app_2_result = app_1_task.result(), app_2_task.result()
     logger.debug("App results: behavior=%r, physiology=%r", app_1_result, app_2_result)
     notify("Both apps finished", MessageLevel.SUCCESS)
 
@@ -214,7 +218,7 @@ async def demo_experiment(launcher: Launcher) -> None:
         task,
         repository=launcher.repository,
         script_path=Path("./mock/script.py"),
-        output_parameters={"suggestion": suggestion.model_dump()},
+        output_parameters={"suggestion": suggestion.model_dump(mode="json")},
     ).map()
 
     logger.info("Demo experiment finished")
@@ -224,6 +228,8 @@ async def demo_experiment(launcher: Launcher) -> None:
 
 def _seed_cache() -> None:
     """Pre-populate the selection caches so autocompletion has options to filter."""
+    from clabe.cache_manager import CacheManager
+
     cache = CacheManager.get_instance()
     cache.register_cache("subjects", max_history=20)
     cache.register_cache("experimenters", max_history=20)
@@ -233,17 +239,15 @@ def _seed_cache() -> None:
         cache.add_to_cache("experimenters", experimenter)
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_cli(cli_args: tuple[str, ...]) -> LauncherCliArgs:
+    from pydantic_settings import CliApp
+
+    return CliApp.run(LauncherCliArgs, cli_args=list(cli_args))
+
+
 def main():
-    settings = CliApp.run(
-        LauncherCliArgs,
-        cli_args=[
-            "--allow-dirty",
-            "--skip-hardware-validation",
-            "--verbose",
-            "--frontend",
-            "tui",
-        ],
-    )
+    settings = _parse_cli(("--allow-dirty", "--skip-hardware-validation", "--verbose", "--frontend", "tui"))
     Launcher(settings=settings).run_experiment(demo_experiment)
     return None
 
@@ -1,3 +1,4 @@
+import functools
 import logging
 from pathlib import Path
 
@@ -65,17 +66,15 @@ async def client_experiment(launcher: Launcher) -> None:
     return
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_cli(cli_args: tuple[str, ...]) -> LauncherCliArgs:
+    return CliApp.run(LauncherCliArgs, cli_args=list(cli_args))
+
+
 def main():
     create_fake_subjects()
     create_fake_rig()
-    behavior_cli_args = CliApp.run(
-        LauncherCliArgs,
-        cli_args=[
-            "--debug-mode",
-            "--allow-dirty",
-            "--skip-hardware-validation",
-        ],
-    )
+    behavior_cli_args = _parse_cli(("--debug-mode", "--allow-dirty", "--skip-hardware-validation"))
 
     launcher = Launcher(settings=behavior_cli_args)
     launcher.run_experiment(client_experiment)
@@ -57,10 +57,10 @@ async def demo_experiment(launcher: Launcher) -> None:
     app_1 = PythonScriptApp(script=fmt("Behavior"))
     app_2 = PythonScriptApp(script=fmt("Physiology"))
 
-    app_1_result, app_2_result = await asyncio.gather(
-        runnable(app_1.run_async, name="Running Behavior App")(),
-        runnable(app_2.run_async, name="Running Physiology App")(),
-    )
+    # A TaskGroup cancels the sibling app as soon as one of them fails.
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(runnable(app_1.run_async, name="Running Behavior App")())
+        tg.create_task(runnable(app_2.run_async, name="Running Physiology App")())
 
     suggestion = CurriculumApp(
         settings=CurriculumSettings(
@@ -77,7 +77,7 @@ async def demo_experiment(launcher: Launcher) -> None:
         task,
         repository=launcher.repository,
         script_path=Path("./mock/script.py"),
-        output_parameters={"suggestion": suggestion.model_dump()},
+        output_parameters={"suggestion": suggestion.model_dump(mode="json")},
     ).map()
     return
 
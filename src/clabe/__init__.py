@@ -1,13 +1,27 @@
+import functools
 import logging
-from importlib.metadata import PackageNotFoundError, version
-
-try:
-    __version__ = version("aind-clabe")
-except PackageNotFoundError:
-    __version__ = "0.0.0"
+from typing import Any
 
 from . import logging_helper
 
+
+@functools.cache
+def _get_version() -> str:
+    """Resolves the installed distribution version, scanning package metadata only once."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("aind-clabe")
+    except PackageNotFoundError:
+        return "0.0.0"
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        return _get_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 logger = logging.getLogger(__name__)
 
 logging.basicConfig(
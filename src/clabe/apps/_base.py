@@ -71,6 +71,24 @@ class CommandResult(BaseModel):
     stderr: Optional[str]
     exit_code: int
 
+    @classmethod
+    def from_trusted(cls, stdout: Optional[str], stderr: Optional[str], exit_code: int) -> Self:
+        """
+        Build a result from values that are already known to have the right types.
+
+        Skips pydantic validation, so it should only be used by executors that
+        take the values directly from a completed subprocess.
+
+        Args:
+            stdout: Standard output from the command
+            stderr: Standard error from the command
+            exit_code: Exit code returned by the command
+
+        Returns:
+            Self: The unvalidated command result
+        """
+        return cls.model_construct(stdout=stdout, stderr=stderr, exit_code=exit_code)
+
     @property
     def ok(self) -> bool:
         """Check if the command executed successfully by examining the exit code."""
@@ -115,6 +133,8 @@ class ExecutableApp(Protocol):
         ```
     """
 
+    __slots__ = ()
+
     @property
     def command(self) -> "Command":
         """Get the command to execute."""
@@ -209,6 +229,9 @@ class Command(Generic[TOutput]):
         ```
     """
 
+    # Commands are created per execution, so instances skip the per-object __dict__
+    __slots__ = ("_cmd", "_owns_cmd", "_output_parser", "_result", "__orig_class__")
+
     def __init__(self, cmd: list[str], output_parser: _OutputParser[TOutput]) -> None:
         """Initialize the Command instance.
 
@@ -223,6 +246,8 @@ class Command(Generic[TOutput]):
             ```
         """
         self._cmd: list[str] = cmd
+        # The caller's list is only copied on the first append_arg, later appends extend in place
+        self._owns_cmd = False
         self._output_parser = output_parser
         self._result: Optional[CommandResult] = None
 
@@ -257,21 +282,31 @@ class Command(Generic[TOutput]):
         if isinstance(args, str):
             args = [args]
         args = [arg for arg in args if arg]
-        self._cmd = self._cmd + args
+        if self._owns_cmd:
+            self._cmd.extend(args)
+        else:
+            self._cmd = self._cmd + args
+            self._owns_cmd = True
         return self
 
     def execute(self, executor: Executor) -> TOutput:
         """Execute using a synchronous executor."""
-        logger.info("Executing command: %s", self._cmd)
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info("Executing command: %s", self._cmd)
         self._set_result(executor.run(self))
-        logger.info("Command execution completed.")
+        if log_info:
+            logger.info("Command execution completed.")
         return self._parse_output(self.result)
 
     async def execute_async(self, executor: AsyncExecutor) -> TOutput:
         """Execute using an async executor."""
-        logger.info("Executing command asynchronously: %s", self._cmd)
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info("Executing command asynchronously: %s", self._cmd)
         self._set_result(await executor.run_async(self))
-        logger.info("Command execution completed.")
+        if log_info:
+            logger.info("Command execution completed.")
         return self._parse_output(self.result)
 
     def _set_result(self, result: CommandResult, override: bool = True) -> None:
@@ -284,6 +319,9 @@ class Command(Generic[TOutput]):
 
     def _parse_output(self, result: CommandResult) -> TOutput:
         """Parse the output of the command."""
+        # The identity parser is the common case and needs no call
+        if self._output_parser is identity_parser:
+            return result  # type: ignore[return-value]
         return self._output_parser(result)
 
 
@@ -299,6 +337,8 @@ class StdCommand(Command[CommandResult]):
         ```
     """
 
+    __slots__ = ()
+
     def __init__(self, cmd: list[str]) -> None:
         super().__init__(cmd, identity_parser)
 
@@ -17,6 +17,15 @@ from ._executors import _DefaultExecutorMixin
 logger = logging.getLogger(__name__)
 
 
+# Flags for each (is_editor_mode, is_start_flag) combination; --start only applies in editor mode
+_MODE_FLAGS: Dict[tuple[bool, bool], tuple[str, ...]] = {
+    (True, True): ("--start",),
+    (True, False): (),
+    (False, True): ("--no-editor",),
+    (False, False): ("--no-editor",),
+}
+
+
 class BonsaiApp(ExecutableApp, _DefaultExecutorMixin):
     """
     A class to manage the execution of Bonsai workflows.
@@ -31,6 +40,15 @@ class BonsaiApp(ExecutableApp, _DefaultExecutorMixin):
         validate: Validates the Bonsai application configuration
     """
 
+    __slots__ = (
+        "workflow",
+        "_executable",
+        "is_editor_mode",
+        "is_start_flag",
+        "_additional_externalized_properties",
+        "_command",
+    )
+
     def __init__(
         self,
         workflow: os.PathLike,
@@ -74,25 +92,31 @@ class BonsaiApp(ExecutableApp, _DefaultExecutorMixin):
         if not skip_validation:
             self.validate()
 
-        __cmd = self._build_bonsai_process_command(
-            workflow_file=self.workflow,
-            bonsai_exe=self.executable,
-            is_editor_mode=self.is_editor_mode,
-            is_start_flag=self.is_start_flag,
-            additional_properties=additional_externalized_properties or {},
+        # Copied so later changes to the caller's dict do not leak into the lazily built command
+        self._additional_externalized_properties = (
+            dict(additional_externalized_properties) if additional_externalized_properties else None
         )
-        self._command = Command[CommandResult](cmd=__cmd, output_parser=identity_parser)
+        self._command: Optional[Command[CommandResult]] = None
 
     @property
     def executable(self) -> Path:
         """Returns the path to the Bonsai executable after validation."""
         if self._executable is None:
             raise ValueError("Executable path is not set.")
-        return Path(self._executable)
+        return self._executable if isinstance(self._executable, Path) else Path(self._executable)
 
     @property
     def command(self) -> Command[CommandResult]:
-        """Get the command to execute."""
+        """Get the command to execute, building it on first access."""
+        if self._command is None:
+            cmd = self._build_bonsai_process_command(
+                workflow_file=self.workflow,
+                bonsai_exe=self.executable,
+                is_editor_mode=self.is_editor_mode,
+                is_start_flag=self.is_start_flag,
+                additional_properties=self._additional_externalized_properties,
+            )
+            self._command = Command[CommandResult](cmd=cmd, output_parser=identity_parser)
         return self._command
 
     def validate(self) -> None:
@@ -116,9 +140,9 @@ class BonsaiApp(ExecutableApp, _DefaultExecutorMixin):
                 if (loc := shutil.which(potential_exe)) is not None:
                     self._executable = Path(loc)
 
-        if (not self._executable) or (not Path(self.executable).exists()):
+        if (not self._executable) or (not self.executable.exists()):
             raise FileNotFoundError(f"Executable not found: {self._executable}")
-        if not Path(self.workflow).exists():
+        if not self.workflow.exists():
             raise FileNotFoundError(f"Workflow file not found: {self.workflow}")
         if self.is_editor_mode:
             logger.warning("Bonsai will run in editor mode. Will probably not be able to assert successful completion.")
@@ -163,17 +187,14 @@ class BonsaiApp(ExecutableApp, _DefaultExecutorMixin):
             # Returns: ["./.bonsai/bonsai.exe", "workflow.bonsai", "--no-editor", "-p:SubjectName=Mouse123"]
             ```
         """
-        output_cmd: List[str] = [str(bonsai_exe), str(workflow_file)]
-
-        if is_editor_mode:
-            if is_start_flag:
-                output_cmd.append("--start")
-        else:
-            output_cmd.append("--no-editor")
+        output_cmd: List[str] = [
+            str(bonsai_exe),
+            str(workflow_file),
+            *_MODE_FLAGS[(bool(is_editor_mode), bool(is_start_flag))],
+        ]
 
         if additional_properties:
-            for param, value in additional_properties.items():
-                output_cmd.append(f"-p:{param}={value}")
+            output_cmd.extend(f"-p:{param}={value}" for param, value in additional_properties.items())
 
         return output_cmd
 
@@ -194,6 +215,8 @@ class AindBehaviorServicesBonsaiApp(BonsaiApp):
         ```
     """
 
+    __slots__ = ("_temp_directory",)
+
     def __init__(
         self,
         workflow: os.PathLike,
@@ -251,15 +274,13 @@ class AindBehaviorServicesBonsaiApp(BonsaiApp):
             # -p:"TaskPath"="/tmp/task_temp.json"
             ```
         """
-        self._temp_directory = Path(temp_directory or TMP_DIR)
+        # Made absolute once so every saved model path is already absolute
+        self._temp_directory = Path(os.path.abspath(temp_directory or TMP_DIR))
 
         additional_externalized_properties = kwargs.pop("additional_externalized_properties", {}) or {}
-        if rig:
-            additional_externalized_properties["RigPath"] = os.path.abspath(self._save_temp_model(model=rig))
-        if session:
-            additional_externalized_properties["SessionPath"] = os.path.abspath(self._save_temp_model(model=session))
-        if task:
-            additional_externalized_properties["TaskPath"] = os.path.abspath(self._save_temp_model(model=task))
+        for name, model in (("RigPath", rig), ("SessionPath", session), ("TaskPath", task)):
+            if model:
+                additional_externalized_properties[name] = os.fspath(self._save_temp_model(model=model))
         super().__init__(
             workflow=workflow, additional_externalized_properties=additional_externalized_properties, **kwargs
         )
@@ -283,4 +304,4 @@ class AindBehaviorServicesBonsaiApp(BonsaiApp):
         fpath = self._temp_directory / f"{model.__class__.__name__}_{sha_hash}.json"
         with open(fpath, "w+", encoding="utf-8") as f:
             f.write(model.model_dump_json(indent=2))
-        return Path(fpath)
+        return fpath
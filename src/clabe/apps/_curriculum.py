@@ -104,6 +104,8 @@ class CurriculumApp(ExecutableApp, _DefaultExecutorMixin):
         ```
     """
 
+    __slots__ = ("_settings", "_python_script_app")
+
     def __init__(
         self, settings: CurriculumSettings, *, python_script_app_kwargs: dict[str, t.Any] | None = None
     ) -> None:
@@ -144,19 +146,22 @@ class CurriculumApp(ExecutableApp, _DefaultExecutorMixin):
         if self._settings.data_directory is None:
             raise ValueError("Data directory is not set.")
 
-        kwargs: dict[str, t.Any] = {  # Must use kebab casing
-            "data-directory": str(self._settings.data_directory),
-            "input-trainer-state": str(self._settings.input_trainer_state),
-        }
+        # Passed as argv entries, so values need no quoting. Flags must use kebab casing
+        additional_arguments = [
+            "--data-directory",
+            os.fspath(self._settings.data_directory),
+            "--input-trainer-state",
+            os.fspath(self._settings.input_trainer_state),
+        ]
         if self._settings.curriculum is not None:
-            kwargs["curriculum"] = str(self._settings.curriculum)
+            additional_arguments += ["--curriculum", str(self._settings.curriculum)]
 
         python_script_app_kwargs = python_script_app_kwargs or {}
         self._python_script_app = PythonScriptApp(
             script=settings.script,
             project_directory=settings.project_directory,
             extra_uv_arguments="-q",
-            additional_arguments=[arg for kv in kwargs.items() for arg in ("--" + kv[0], str(kv[1]))],
+            additional_arguments=additional_arguments,
             **python_script_app_kwargs,
         )
 
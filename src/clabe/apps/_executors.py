@@ -47,12 +47,13 @@ class LocalExecutor(Executor):
         """Initialize the local executor.
 
         Args:
-            cwd: Working directory for command execution
+            cwd: Working directory for command execution. Defaults to None, which uses the current working directory
             env: Environment variables for the subprocess
             timeout: Maximum execution time in seconds
 
         """
-        self.cwd = cwd or os.getcwd()
+        # None lets the subprocess inherit the working directory without a getcwd call
+        self.cwd = cwd or None
         self.env = env
         self.timeout = timeout
 
@@ -85,7 +86,7 @@ class LocalExecutor(Executor):
             timeout=self.timeout,
             shell=False,
         )
-        result = CommandResult(stdout=proc.stdout, stderr=proc.stderr, exit_code=proc.returncode)
+        result = CommandResult.from_trusted(stdout=proc.stdout, stderr=proc.stderr, exit_code=proc.returncode)
         result.check_returncode()
         return result
 
@@ -132,12 +133,13 @@ class AsyncLocalExecutor(AsyncExecutor):
         """Initialize the asynchronous local executor.
 
         Args:
-            cwd: Working directory for command execution
+            cwd: Working directory for command execution. Defaults to None, which uses the current working directory
             env: Environment variables for the subprocess
             timeout: Maximum execution time in seconds
 
         """
-        self.cwd = cwd or os.getcwd()
+        # None lets the subprocess inherit the working directory without a getcwd call
+        self.cwd = cwd or None
         self.env = env
         self.timeout = timeout
 
@@ -180,7 +182,7 @@ class AsyncLocalExecutor(AsyncExecutor):
         if proc.returncode is None:
             raise RuntimeError("Process did not complete successfully and returned no return code.")
 
-        command_result = CommandResult(
+        command_result = CommandResult.from_trusted(
             stdout=stdout.decode(),
             stderr=stderr.decode(),
             exit_code=proc.returncode,
@@ -216,10 +218,11 @@ class LocalDetachedExecutor(Executor):
         """Initialize the detached executor.
 
         Args:
-            cwd: Working directory for command execution
+            cwd: Working directory for command execution. Defaults to None, which uses the current working directory
             env: Environment variables for the subprocess
         """
-        self.cwd = cwd or os.getcwd()
+        # None lets the subprocess inherit the working directory without a getcwd call
+        self.cwd = cwd or None
         self.env = env
 
     def run(self, command: Command[Any]) -> CommandResult:
@@ -247,7 +250,7 @@ class LocalDetachedExecutor(Executor):
             stderr=subprocess.DEVNULL,
             shell=False,
         )
-        return CommandResult(stdout=None, stderr=None, exit_code=0)
+        return CommandResult.from_trusted(stdout=None, stderr=None, exit_code=0)
 
 
 class _DefaultExecutorMixin:
@@ -276,6 +279,8 @@ class _DefaultExecutorMixin:
         ```
     """
 
+    __slots__ = ()
+
     if TYPE_CHECKING:
         # ``command`` is supplied by the ``ExecutableApp`` this mixin is combined
         # with. Declaring it here lets the type checker resolve ``self.command``
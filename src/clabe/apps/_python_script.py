@@ -50,6 +50,8 @@ class PythonScriptApp(ExecutableApp, _DefaultExecutorMixin):
         ```
     """
 
+    __slots__ = ("_command",)
+
     def __init__(
         self,
         /,
@@ -148,7 +150,7 @@ class PythonScriptApp(ExecutableApp, _DefaultExecutorMixin):
                 print("Virtual environment found")
             ```
         """
-        return (Path(project_directory) / ".venv").exists()
+        return os.path.exists(os.path.join(project_directory, ".venv"))
 
     @classmethod
     def create_environment(
@@ -222,7 +224,7 @@ class PythonScriptApp(ExecutableApp, _DefaultExecutorMixin):
             # Returns: ["--directory", "/my/project"]
             ```
         """
-        return ["--directory", str(Path(project_directory).resolve())]
+        return ["--directory", os.path.realpath(project_directory)]
 
     @staticmethod
     def _make_uv_optional_toml_dependencies(optional_toml_dependencies: list[str]) -> list[str]:
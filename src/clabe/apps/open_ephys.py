@@ -1,8 +1,11 @@
+import asyncio
 import logging
 import os
+import threading
+import weakref
 from enum import Enum
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Iterable, Literal
 
 import requests
 from pydantic import BaseModel, Field
@@ -77,9 +80,9 @@ class OpenEphysApp(ExecutableApp, _DefaultExecutorMixin):
         Raises:
             FileNotFoundError: If any required file or directory is missing
         """
-        if not Path(self.executable).exists():
+        if not self.executable.exists():
             raise FileNotFoundError(f"Executable not found: {self.executable}")
-        if not Path(self.signal_chain).exists():
+        if not self.signal_chain.exists():
             raise FileNotFoundError(f"Signal chain file not found: {self.signal_chain}")
 
     @property
@@ -92,6 +95,18 @@ class OpenEphysApp(ExecutableApp, _DefaultExecutorMixin):
         """Get the Open Ephys GUI client."""
         return self._client
 
+    def close(self) -> None:
+        """Close the GUI client's persistent connections."""
+        self._client.close()
+
+    def __enter__(self) -> "OpenEphysApp":
+        """Enter the runtime context."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit the runtime context, closing the GUI client."""
+        self.close()
+
 
 class Status(str, Enum):
     """GUI acquisition/recording mode."""
@@ -195,11 +210,32 @@ class WindowRequest(BaseModel):
     command: Literal["quit"]
 
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _close_sessions(sessions: list[requests.Session], lock: threading.Lock) -> None:
+    """Close and forget every session in ``sessions``."""
+    with lock:
+        closing = sessions[:]
+        sessions.clear()
+    for session in closing:
+        session.close()
+
+
 class _OpenEphysGuiClient:
     """Client for interacting with the Open Ephys GUI HTTP Server.
 
     The Open Ephys HTTP Server runs on port 37497 and provides a RESTful API
-    for remote control of the GUI.
+    for remote control of the GUI. The ``*_async`` methods run the same requests
+    in a worker thread so they can be awaited, and gathered, from async code
+    without blocking the event loop.
+
+    Each thread that uses the client gets its own ``requests.Session``, which is not
+    safe to share between threads, and keeps its connection to the GUI alive across
+    requests. Concurrent async calls are therefore limited by the worker threads of
+    the event loop's default executor, each holding at most one connection to the
+    GUI. ``close``, or leaving the client's ``with`` block, releases the sessions of
+    every thread; any left open are closed when the client is garbage collected.
 
     Args:
         host: Hostname or IP address of the machine running the GUI. Defaults to "localhost".
@@ -212,17 +248,46 @@ class _OpenEphysGuiClient:
         self._host = host
         self._port = port
         self._timeout = timeout
+        self._base_url = f"http://{host}:{port}/api"
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+        # Holds the session list rather than the client, so the client can still be collected
+        self._finalizer = weakref.finalize(self, _close_sessions, self._sessions, self._sessions_lock)
+
+    def _get_session(self) -> requests.Session:
+        """Return the calling thread's session, creating it on first use."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self) -> None:
+        """Close the persistent connections to the GUI opened by every thread."""
+        with self._sessions_lock:
+            self._local = threading.local()
+        _close_sessions(self._sessions, self._sessions_lock)
+
+    def __enter__(self) -> "_OpenEphysGuiClient":
+        """Enter the runtime context."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit the runtime context, closing every thread's session."""
+        self.close()
 
     @property
     def base_url(self) -> str:
         """Base URL for the API."""
-        return f"http://{self._host}:{self._port}/api"
+        return self._base_url
 
     def _get(self, endpoint: str) -> dict[str, Any]:
         """Send GET request to the API."""
-        url = f"{self.base_url}{endpoint}"
+        url = self._base_url + endpoint
         logger.debug("Sending GET request to %s", url)
-        response = requests.get(url, timeout=self._timeout)
+        response = self._get_session().get(url, timeout=self._timeout)
         response.raise_for_status()
         result = response.json()
         logger.debug("GET response from %s: %s", url, result)
@@ -230,15 +295,24 @@ class _OpenEphysGuiClient:
 
     def _put(self, endpoint: str, data: BaseModel) -> dict[str, Any]:
         """Send PUT request to the API."""
-        url = f"{self.base_url}{endpoint}"
-        payload = data.model_dump(exclude_none=True)
+        url = self._base_url + endpoint
+        # Serialized straight to JSON by pydantic-core, skipping the intermediate dict
+        payload = data.model_dump_json(exclude_none=True)
         logger.debug("Sending PUT request to %s with payload: %s", url, payload)
-        response = requests.put(url, json=payload, timeout=self._timeout)
+        response = self._get_session().put(url, data=payload, headers=_JSON_HEADERS, timeout=self._timeout)
         response.raise_for_status()
         result = response.json()
         logger.debug("PUT response from %s: %s", url, result)
         return result
 
+    async def _get_async(self, endpoint: str) -> dict[str, Any]:
+        """Send GET request to the API from a worker thread, without blocking the event loop."""
+        return await asyncio.to_thread(self._get, endpoint)
+
+    async def _put_async(self, endpoint: str, data: BaseModel) -> dict[str, Any]:
+        """Send PUT request to the API from a worker thread, without blocking the event loop."""
+        return await asyncio.to_thread(self._put, endpoint, data)
+
     def get_status(self) -> Status:
         """Query the GUI's acquisition/recording status.
 
@@ -264,6 +338,27 @@ class _OpenEphysGuiClient:
         data = self._put("/status", request)
         return StatusResponse(**data).mode
 
+    async def get_status_async(self) -> Status:
+        """Asynchronously query the GUI's acquisition/recording status.
+
+        Returns:
+            Current status containing the GUI mode (IDLE, ACQUIRE, or RECORD).
+        """
+        data = await self._get_async("/status")
+        return StatusResponse(**data).mode
+
+    async def set_status_async(self, mode: Status) -> Status:
+        """Asynchronously set the GUI's acquisition/recording status.
+
+        Args:
+            mode: Desired GUI mode (IDLE, ACQUIRE, or RECORD).
+
+        Returns:
+            Updated status response.
+        """
+        data = await self._put_async("/status", StatusRequest(mode=mode))
+        return StatusResponse(**data).mode
+
     def start_acquisition(self) -> Status:
         """Start data acquisition without recording.
 
@@ -300,6 +395,15 @@ class _OpenEphysGuiClient:
         data = self._get("/recording")
         return RecordingResponse(**data)
 
+    async def get_recording_config_async(self) -> RecordingResponse:
+        """Asynchronously get recording configuration including all Record Nodes.
+
+        Returns:
+            Recording configuration with parent directory and Record Node details.
+        """
+        data = await self._get_async("/recording")
+        return RecordingResponse(**data)
+
     def set_recording_config(
         self,
         parent_directory: str | None = None,
@@ -365,6 +469,15 @@ class _OpenEphysGuiClient:
         data = self._get("/processors")
         return ProcessorsResponse(**data)
 
+    async def get_processors_async(self) -> ProcessorsResponse:
+        """Asynchronously get information about all processors in the signal chain.
+
+        Returns:
+            List of processors with their parameters and streams.
+        """
+        data = await self._get_async("/processors")
+        return ProcessorsResponse(**data)
+
     def get_processor(self, processor_id: int) -> Processor:
         """Get information about a specific processor.
 
@@ -419,6 +532,46 @@ class _OpenEphysGuiClient:
         request = MessageRequest(text=message)
         return self._put("/message", request)
 
+    def broadcast_messages(self, messages: Iterable[str]) -> list[dict[str, Any]]:
+        """Broadcast several messages to all processors, in order.
+
+        The messages are sent one after another over the calling thread's
+        keep-alive session. They are not sent concurrently, because the GUI
+        records them in arrival order.
+
+        Args:
+            messages: Message texts to broadcast.
+
+        Returns:
+            Responses from the API, one per message.
+        """
+        return [self._put("/message", MessageRequest(text=message)) for message in messages]
+
+    async def broadcast_messages_async(self, messages: Iterable[str]) -> list[dict[str, Any]]:
+        """Asynchronously broadcast several messages to all processors, in order.
+
+        All messages are sent from a single worker thread, so the event loop is not
+        blocked and their order is preserved.
+
+        Args:
+            messages: Message texts to broadcast.
+
+        Returns:
+            Responses from the API, one per message.
+        """
+        return await asyncio.to_thread(self.broadcast_messages, list(messages))
+
+    async def broadcast_message_async(self, message: str) -> dict[str, Any]:
+        """Asynchronously broadcast a message to all processors during acquisition.
+
+        Args:
+            message: Message text to broadcast.
+
+        Returns:
+            Response from the API.
+        """
+        return await self._put_async("/message", MessageRequest(text=message))
+
     def quit(self) -> dict[str, Any]:
         """Shut down the GUI remotely.
 
@@ -461,7 +461,7 @@ class WatchdogDataTransferService(DataTransfer[WatchdogSettings]):
             True if the service is running, False otherwise
         """
         output = subprocess.check_output(
-            ["tasklist", "/FI", f"IMAGENAME eq {self.executable_path.name}"], shell=True, encoding="utf-8"
+            ["tasklist", "/FI", f"IMAGENAME eq {self.executable_path.name}"], shell=False, encoding="utf-8"
         )
         processes = [line.split()[0] for line in output.splitlines()[2:]]
         return len(processes) > 0
@@ -478,11 +478,11 @@ class WatchdogDataTransferService(DataTransfer[WatchdogSettings]):
         """
         if kill_if_running is True:
             while self.is_running():
-                subprocess.run(["taskkill", "/IM", self.executable_path.name, "/F"], shell=True, check=True)
+                subprocess.run(["taskkill", "/IM", self.executable_path.name, "/F"], shell=False, check=True)
 
-        cmd_factory = "{exe} -c {config}".format(exe=self.executable_path, config=self.config_path)
-
-        return subprocess.Popen(cmd_factory, start_new_session=True, shell=True)
+        # Launch the executable directly; going through a shell only adds an extra cmd.exe process
+        cmd = [str(self.executable_path), "-c", str(self.config_path)]
+        return subprocess.Popen(cmd, start_new_session=True, shell=False)
 
     def dump_manifest_config(self, path: Optional[os.PathLike] = None, make_dir: bool = True) -> Path:
         """
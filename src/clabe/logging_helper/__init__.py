@@ -5,6 +5,7 @@ from ._stdlib import (
     add_file_handler,
     clabe_console,
     close_file_handlers,
+    configure_levels,
     datetime_fmt,
     log_fmt,
     rich_handler,
@@ -15,6 +16,7 @@ from ._stdlib import (
 __all__ = [
     "add_file_handler",
     "close_file_handlers",
+    "configure_levels",
     "shutdown_logger",
     "rich_handler",
     "set_console_level",
@@ -1,8 +1,13 @@
 import datetime
+import functools
 import logging
+import logging.handlers
 import os
+import queue
+import threading
+import time
 from pathlib import Path
-from typing import TypeVar
+from typing import Optional, TypeVar
 
 import rich.console
 import rich.logging
@@ -47,6 +52,9 @@ class _SeverityHighlightingHandler(rich.logging.RichHandler):
 
         self.error_style = rich.style.Style(color="white", bgcolor="red")
         self.critical_style = rich.style.Style(color="white", bgcolor="red", bold=True)
+        # Render the markup prefixes once instead of stringifying the styles for every record
+        self._error_markup = f"[{self.error_style}]"
+        self._critical_markup = f"[{self.critical_style}]"
 
     def render_message(self, record, message):  # type: ignore[override]
         """
@@ -62,12 +70,12 @@ class _SeverityHighlightingHandler(rich.logging.RichHandler):
         Returns:
             str: The styled message string
         """
-        if record.levelno >= logging.CRITICAL:
-            return f"[{self.critical_style}]{message}[/]"
-        elif record.levelno >= logging.ERROR:
-            return f"[{self.error_style}]{message}[/]"
-        else:
+        if record.levelno < logging.ERROR:
             return message
+        elif record.levelno >= logging.CRITICAL:
+            return self._critical_markup + message + "[/]"
+        else:
+            return self._error_markup + message + "[/]"
 
 
 # Name of the logger used by the frontend to record the user-facing transcript
@@ -130,6 +138,7 @@ class _TzFormatter(logging.Formatter):
             **kwargs: Keyword arguments for the base Formatter class. The 'tz' keyword can be used to specify a timezone
         """
         self._tz = kwargs.pop("tz", None)
+        self._is_utc = self._tz is datetime.timezone.utc
         super().__init__(*args, **kwargs)
 
     def formatTime(self, record, datefmt=None) -> str:
@@ -137,41 +146,263 @@ class _TzFormatter(logging.Formatter):
         Formats the time of a log record using the specified timezone.
 
         Converts the log record timestamp to the configured timezone and formats
-        it using the AIND behavior services datetime formatting utilities.
+        it using the AIND behavior services datetime formatting utilities, or with
+        ``datefmt`` if one is given.
 
         Args:
             record: The log record to format
-            datefmt: An optional date format string (unused). Defaults to None
+            datefmt: An optional strftime format string. Defaults to None
 
         Returns:
             str: A string representation of the formatted time
         """
-        from aind_behavior_services.utils import format_datetime
+        if datefmt is None:
+            return _format_second(int(record.created), self._tz)
+        if self._is_utc:
+            return time.strftime(datefmt, time.gmtime(record.created))
+        return datetime.datetime.fromtimestamp(record.created, tz=self._tz).strftime(datefmt)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_second(timestamp: int, tz: Optional[datetime.tzinfo]) -> str:
+    """
+    Formats a whole-second timestamp in the given timezone.
 
-        record_time = datetime.datetime.fromtimestamp(record.created, tz=self._tz)
-        return format_datetime(record_time)
+    The formatted output has second resolution, so every record logged within the
+    same second shares a single cached string.
+
+    Args:
+        timestamp: Seconds since the epoch
+        tz: The timezone to format the timestamp in, or None for local time
+
+    Returns:
+        str: A string representation of the formatted time
+    """
+    if tz is datetime.timezone.utc:
+        # Same output as format_datetime for UTC, without building a datetime
+        tm = time.gmtime(timestamp)
+        return "%04d-%02d-%02dT%02d%02d%02dZ" % (tm.tm_year, tm.tm_mon, tm.tm_mday, tm.tm_hour, tm.tm_min, tm.tm_sec)
+
+    from aind_behavior_services.utils import format_datetime
+
+    return format_datetime(datetime.datetime.fromtimestamp(timestamp, tz=tz))
 
 
 utc_formatter = _TzFormatter(log_fmt, tz=datetime.timezone.utc)
 
 
-def add_file_handler(logger: TLogger, output_path: os.PathLike) -> TLogger:
+#: Default size, in bytes, of the write buffer used by file log handlers.
+DEFAULT_LOG_BUFFER_SIZE = 256 * 1024
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    A file handler that buffers writes and only flushes eagerly for errors.
+
+    ``logging.StreamHandler`` flushes after every record, which turns each log line
+    into its own write syscall. This handler opens the file with a larger buffer and
+    lets records accumulate, flushing immediately only for ``ERROR`` and above so
+    failures reach the disk right away. Remaining records are flushed on close.
+
+    Attributes:
+        buffer_size (int): Size of the write buffer in bytes
+    """
+
+    def __init__(self, *args, buffer_size: int = DEFAULT_LOG_BUFFER_SIZE, **kwargs) -> None:
+        """
+        Initializes the buffered file handler.
+
+        Args:
+            *args: Positional arguments for the base FileHandler class
+            buffer_size: Size of the write buffer in bytes. Defaults to DEFAULT_LOG_BUFFER_SIZE
+            **kwargs: Keyword arguments for the base FileHandler class
+        """
+        self.buffer_size = buffer_size
+        self._defer_flush = False
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        """Opens the log file with the configured buffer size."""
+        return open(
+            self.baseFilename, self.mode, buffering=self.buffer_size, encoding=self.encoding, errors=self.errors
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Writes the record, flushing the buffer only for ERROR and above.
+
+        Args:
+            record: The log record to write
+        """
+        self._defer_flush = record.levelno < logging.ERROR
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
+
+    def flush(self) -> None:
+        """Flushes the buffer unless called from ``emit`` for a low-severity record."""
+        if not self._defer_flush:
+            super().flush()
+
+
+class _QueuedFileHandler(logging.handlers.QueueHandler):
+    """
+    A queue handler that forwards records to a file handler on a background thread.
+
+    Logging calls only enqueue the record; a ``QueueListener`` owned by this handler
+    performs the formatting and disk writes, so callers never block on file I/O.
+
+    The handler may be shared by several loggers writing to the same file; it keeps
+    count of them and ``release`` only closes it once the last one detaches.
+
+    Attributes:
+        file_handler (logging.FileHandler): The handler that writes records to disk
+        listener (logging.handlers.QueueListener): The listener draining the queue into ``file_handler``
+    """
+
+    def __init__(self, file_handler: logging.FileHandler) -> None:
+        """
+        Initializes the handler and starts its listener thread.
+
+        Args:
+            file_handler: The file handler that will receive the queued records
+        """
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        super().__init__(log_queue)
+        self.file_handler = file_handler
+        self.listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+        self.listener.start()
+        self._listening = True
+        self._closed = False
+        self._users = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Enqueues the record for the listener, or drops it once the handler is closed.
+
+        Args:
+            record: The log record to enqueue
+        """
+        if self._closed:
+            return
+        super().emit(record)
+
+    def release(self) -> None:
+        """
+        Drops one logger's reference to the handler, closing it when none remain.
+        """
+        with self.lock:
+            self._users -= 1
+            last_user = self._users <= 0
+        if last_user:
+            self.close()
+
+    def close(self) -> None:
+        """
+        Drains any pending records to disk, stops the listener and closes the file handler.
+
+        Closing affects every logger sharing the handler. Records emitted after closing are dropped instead of piling up in the queue.
+        """
+        with self.lock:
+            self._closed = True
+            if self._listening:
+                self.listener.stop()
+                self._listening = False
+            self.file_handler.close()
+        with _file_handlers_lock:
+            for path in [path for path, handler in _file_handlers.items() if handler is self]:
+                del _file_handlers[path]
+        super().close()
+
+
+_FILE_HANDLER_TYPES = (logging.FileHandler, _QueuedFileHandler)
+
+# Open file handlers keyed by absolute log path, so re-attaching the same file reuses its handler
+_file_handlers: dict[str, _QueuedFileHandler] = {}
+_file_handlers_lock = threading.Lock()
+
+
+def add_file_handler(logger: TLogger, output_path: os.PathLike, buffer_size: int = DEFAULT_LOG_BUFFER_SIZE) -> TLogger:
     """
     Adds a file handler to the logger to write logs to a file.
 
-    Creates a new file handler with UTC timezone formatting and adds it to the
-    specified logger for persistent log storage.
+    Creates a new file handler with UTC timezone formatting and attaches it to the
+    specified logger through a queue, so records are written to disk by a background
+    thread instead of the logging caller. If a handler for the same file is already
+    open, it is reused instead of reopening (and truncating) the file; in that case
+    ``buffer_size`` is ignored. A shared handler is only closed by
+    ``close_file_handlers`` once every logger using it has been closed.
 
     Args:
         logger: The logger to which the file handler will be added
         output_path: The path to the log file
+        buffer_size: Size of the file write buffer in bytes. Defaults to DEFAULT_LOG_BUFFER_SIZE
 
     Returns:
         TLogger: The logger with the added file handler
     """
-    file_handler = logging.FileHandler(Path(output_path), encoding="utf-8", mode="w")
-    file_handler.setFormatter(utc_formatter)
-    logger.addHandler(file_handler)
+    path = os.path.abspath(output_path)
+    with _file_handlers_lock:
+        handler = _file_handlers.get(path)
+        if handler is None:
+            file_handler = _BufferedFileHandler(Path(output_path), encoding="utf-8", mode="w", buffer_size=buffer_size)
+            file_handler.setFormatter(utc_formatter)
+            handler = _file_handlers[path] = _QueuedFileHandler(file_handler)
+        if handler not in logger.handlers:
+            with handler.lock:
+                handler._users += 1
+            logger.addHandler(handler)
+    return logger
+
+
+def configure_levels(
+    logger: TLogger,
+    console: Optional[int] = None,
+    file: Optional[int] = None,
+    socket: Optional[int] = None,
+) -> TLogger:
+    """
+    Sets the levels of the console, file and socket handlers coherently.
+
+    Each given level is applied to the matching handlers attached to the logger
+    (the console level applies to the shared console handler). The logger level
+    is then set to the lowest threshold among every handler a record from the
+    logger can reach, whether configured by this call or not, including those
+    of ancestor loggers it propagates to and the console handler. Records no
+    handler would emit are thus discarded before a ``LogRecord`` is even
+    created, instead of being rendered and dropped by each handler. If any of
+    those handlers has no level set, the logger level is left unchanged.
+
+    For expensive log arguments, pair this with lazy ``%s``-style arguments or a
+    ``logger.isEnabledFor(level)`` check rather than building f-strings up front.
+
+    Args:
+        logger: The logger whose handlers will be configured
+        console: Level for the interactive console handler. Defaults to None (unchanged)
+        file: Level for file handlers attached to the logger. Defaults to None (unchanged)
+        socket: Level for socket handlers, such as the AIBS log server handler. Defaults to None (unchanged)
+
+    Returns:
+        TLogger: The configured logger
+    """
+    if console is not None:
+        set_console_level(console)
+    for handler in list(logger.handlers):
+        if file is not None and isinstance(handler, _FILE_HANDLER_TYPES):
+            handler.setLevel(file)
+        elif socket is not None and isinstance(handler, logging.handlers.SocketHandler):
+            handler.setLevel(socket)
+
+    # Records also reach the handlers of ancestor loggers, so their thresholds bound the logger level too
+    handlers = {rich_handler}
+    current: Optional[logging.Logger] = logger
+    while current is not None:
+        handlers.update(current.handlers)
+        current = current.parent if current.propagate else None
+    levels = [handler.level for handler in handlers]
+    if all(level > logging.NOTSET for level in levels):
+        logger.setLevel(min(levels))
     return logger
 
 
@@ -195,10 +426,12 @@ def shutdown_logger(logger: TLogger) -> TLogger:
 
 def close_file_handlers(logger: TLogger) -> TLogger:
     """
-    Closes all file handlers associated with the logger.
+    Closes all file handlers associated with the logger and detaches them.
 
-    Iterates through all handlers associated with the logger and closes any
-    file handlers to ensure proper resource cleanup.
+    Iterates through all handlers associated with the logger, removes any file
+    handlers from it and closes them to ensure proper resource cleanup. Queued
+    file handlers shared with other loggers stay open until the last of those
+    loggers is closed, and flush their pending records to disk before closing.
 
     Args:
         logger: The logger whose file handlers will be closed
@@ -206,7 +439,11 @@ def close_file_handlers(logger: TLogger) -> TLogger:
     Returns:
         TLogger: The logger with closed file handlers
     """
-    for handler in logger.handlers:
-        if isinstance(handler, logging.FileHandler):
+    # Snapshot the matching handlers first so handlers added concurrently do not affect the iteration
+    for handler in [h for h in logger.handlers if isinstance(h, _FILE_HANDLER_TYPES)]:
+        logger.removeHandler(handler)
+        if isinstance(handler, _QueuedFileHandler):
+            handler.release()
+        else:
             handler.close()
     return logger
@@ -1,7 +1,13 @@
 import logging
 import logging.handlers
 import os
-from typing import TYPE_CHECKING, ClassVar, TypeVar
+import pickle
+import queue
+import socket
+import struct
+import threading
+import time
+from typing import TYPE_CHECKING, ClassVar, Literal, Optional, TypeVar
 
 import pydantic
 
@@ -55,45 +61,204 @@ class AibsLogServerHandler(logging.handlers.SocketHandler):
     A custom logging handler that sends log records to the AIBS log server.
 
     Extends the standard SocketHandler to include project-specific metadata
-    in the log records before sending them to the log server.
+    in the log records before sending them to the log server. Pickled records
+    are handed to a background sender thread through a bounded queue, so a slow
+    or unreachable log server never blocks the logging caller. The sender
+    batches records and writes them together, either once ``batch_size`` bytes
+    are pending or ``flush_interval`` seconds after the first pending record.
     """
 
     def __init__(
         self,
         settings: AibsLogServerHandlerSettings,
         *args,
+        batch_size: int = 32 * 1024,
+        flush_interval: float = 0.2,
+        max_queue_size: int = 1024,
+        overflow_policy: Literal["drop", "block"] = "drop",
+        close_timeout: float = 5.0,
         **kwargs,
     ):
         """
-        Initializes the AIBS log server handler.
+        Initializes the AIBS log server handler and starts its sender thread.
 
         Args:
             settings: Configuration for the handler
             *args: Additional arguments to pass to the SocketHandler
+            batch_size: Number of pending bytes that triggers an immediate send. Defaults to 32 KiB
+            flush_interval: Maximum time in seconds a record waits to be batched before being sent. Defaults to 0.2
+            max_queue_size: Maximum number of records waiting to be sent. Defaults to 1024
+            overflow_policy: Whether to drop records or block the caller when the queue is full. Defaults to "drop"
+            close_timeout: Maximum time in seconds to wait for pending records on flush or close. Defaults to 5.0
             **kwargs: Additional keyword arguments to pass to the SocketHandler
         """
         super().__init__(settings.host, settings.port, *args, **kwargs)
         self.setLevel(settings.level)
         self._settings = settings
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._overflow_policy = overflow_policy
+        self._close_timeout = close_timeout
+        self.dropped_records = 0
+        # Project metadata is constant per handler, so it is merged into the payload instead of stamped on each record
+        self._static_fields = {
+            "project": settings.project_name,
+            "rig_id": settings.rig_id,
+            "comp_id": settings.comp_id,
+            "version": settings.version,
+            "extra": None,  # set extra to None because this sends a pickled record
+        }
 
         self.formatter = logging.Formatter(
             fmt="%(asctime)s\n%(name)s\n%(levelname)s\n%(funcName)s (%(filename)s:%(lineno)d)\n%(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
 
+        self._addr_info: Optional[tuple] = None
+
+        self._queue: queue.Queue[bytes] = queue.Queue(maxsize=max_queue_size)
+        self._stopping = threading.Event()
+        self._sender = threading.Thread(target=self._run_sender, name="AibsLogServerSender", daemon=True)
+        self._sender.start()
+
+    def makeSocket(self, timeout: float = 1) -> socket.socket:
+        """
+        Connects to the log server using a cached address lookup.
+
+        The host is resolved on the first connection and the result is reused for
+        reconnects, so they skip DNS. A failed connection discards the cached
+        address so the next attempt resolves the host again.
+
+        Args:
+            timeout: Socket timeout in seconds. Defaults to 1
+
+        Returns:
+            socket.socket: The connected socket
+        """
+        if self._addr_info is None:
+            self._addr_info = socket.getaddrinfo(self.host, self.port, type=socket.SOCK_STREAM)[0]
+        family, sock_type, proto, _, sockaddr = self._addr_info
+        sock = socket.socket(family, sock_type, proto)
+        try:
+            sock.settimeout(timeout)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.connect(sockaddr)
+        except OSError:
+            sock.close()
+            self._addr_info = None
+            raise
+        return sock
+
+    def makePickle(self, record: logging.LogRecord) -> bytes:
+        """
+        Pickles the record and the project metadata with a length prefix, ready for transmission to the log server.
+
+        Produces the same payload as ``SocketHandler.makePickle``, which the log server
+        expects, but only renders the exception text instead of formatting the whole
+        record to obtain it.
+
+        Args:
+            record: The log record to serialize
+
+        Returns:
+            bytes: The length-prefixed pickled record
+        """
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatter.formatException(record.exc_info)
+        d = dict(record.__dict__)
+        # Send the merged message rather than msg/args, which may not be picklable or importable remotely
+        d["msg"] = record.getMessage()
+        d["args"] = None
+        d["exc_info"] = None
+        d.pop("message", None)
+        d.update(self._static_fields)
+        s = pickle.dumps(d, 1)
+        return struct.pack(">L", len(s)) + s
+
     def emit(self, record: logging.LogRecord) -> None:
         """
-        Emits a log record with project-specific metadata.
+        Queues a log record for sending.
 
         Args:
             record: The log record to emit
         """
-        record.project = self._settings.project_name
-        record.rig_id = self._settings.rig_id
-        record.comp_id = self._settings.comp_id
-        record.version = self._settings.version
-        record.extra = None  # set extra to None because this sends a pickled record
-        super().emit(record)
+        if record.levelno < self.level or self._stopping.is_set():
+            return
+        try:
+            data = self.makePickle(record)
+        except Exception:
+            self.handleError(record)
+            return
+        try:
+            self._queue.put_nowait(data)
+        except queue.Full:
+            if self._overflow_policy == "block":
+                self._queue.put(data)
+            else:
+                self.dropped_records += 1
+
+    def _run_sender(self) -> None:
+        """
+        Collects queued records into batches and sends them to the log server.
+
+        An empty payload in the queue is a flush marker that sends the current batch immediately.
+        """
+        while not (self._stopping.is_set() and self._queue.empty()):
+            batch = bytearray()
+            deadline: Optional[float] = None
+            taken = 0
+            try:
+                while len(batch) < self._batch_size:
+                    timeout = None if deadline is None else deadline - time.monotonic()
+                    if timeout is not None and timeout <= 0:
+                        break
+                    try:
+                        data = self._queue.get(timeout=timeout)
+                    except queue.Empty:
+                        break
+                    taken += 1
+                    if not data:
+                        break
+                    batch += data
+                    if deadline is None:
+                        deadline = time.monotonic() + self._flush_interval
+                if batch:
+                    self.send(bytes(batch))
+            finally:
+                for _ in range(taken):
+                    self._queue.task_done()
+
+    def flush(self) -> None:
+        """
+        Blocks until every queued record has been sent, waiting at most ``close_timeout`` seconds.
+        """
+        if not self._sender.is_alive():
+            return
+        deadline = time.monotonic() + self._close_timeout
+        try:
+            self._queue.put(b"", timeout=self._close_timeout)
+        except queue.Full:
+            return
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                self._queue.all_tasks_done.wait(remaining)
+
+    def close(self) -> None:
+        """
+        Sends pending records, waiting at most ``close_timeout`` seconds, and closes the socket.
+        """
+        if not self._stopping.is_set():
+            self._stopping.set()
+            try:
+                self._queue.put_nowait(b"")
+            except queue.Full:
+                pass  # the sender exits on its own once the queue drains
+            self._sender.join(self._close_timeout)
+        super().close()
 
 
 def add_handler(
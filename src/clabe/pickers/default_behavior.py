@@ -1,4 +1,4 @@
-import glob
+import functools
 import logging
 import os
 from pathlib import Path
@@ -35,6 +35,31 @@ class DefaultBehaviorPickerSettings(ServiceSettings):
     config_library_dir: os.PathLike
 
 
+def _list_json_files(directory: os.PathLike | str) -> List[str]:
+    """
+    Lists the non-hidden ``.json`` files directly inside a directory.
+
+    Equivalent to ``glob.glob(os.path.join(directory, "*.json"))`` restricted to
+    files, but reads the names from a single ``os.scandir`` pass instead of
+    matching each entry against a pattern.
+
+    Args:
+        directory: The directory to search
+
+    Returns:
+        List[str]: Paths to the matching files, or an empty list if the directory does not exist
+    """
+    try:
+        with os.scandir(directory) as it:
+            return [
+                entry.path
+                for entry in it
+                if entry.name.endswith(".json") and not entry.name.startswith(".") and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
 class DefaultBehaviorPicker:
     """
     A picker class for selecting rig, session, and task configurations.
@@ -146,15 +171,18 @@ class DefaultBehaviorPicker:
         """
         return Path(self._settings.config_library_dir)
 
-    @property
+    @functools.cached_property
     def rig_dir(self) -> Path:
         """
         Returns the path to the rig configuration directory.
 
+        The computer name is fixed for the lifetime of the launcher, so the path
+        is composed once and reused.
+
         Returns:
             Path: The rig configuration directory
         """
-        return Path(os.path.join(self.config_library_dir, self.RIG_SUFFIX, self._launcher.computer_name))
+        return self.config_library_dir / self.RIG_SUFFIX / self._launcher.computer_name
 
     @property
     def subject_dir(self) -> Path:
@@ -229,7 +257,7 @@ class DefaultBehaviorPicker:
 
         # Prompt user to select a rig if not already selected
         while rig_path is None:
-            available_rigs = glob.glob(os.path.join(self.rig_dir, "*.json"))
+            available_rigs = _list_json_files(self.rig_dir)
             # We raise if no rigs are found to prevent an infinite loop
             if len(available_rigs) == 0:
                 self.frontend.notify("No rig config files found.", ui.MessageLevel.ERROR)
@@ -348,7 +376,7 @@ class DefaultBehaviorPicker:
         while task is None:
             try:
                 _path = Path(os.path.join(self.config_library_dir, self.task_dir))
-                available_files = glob.glob(os.path.join(_path, "*.json"))
+                available_files = _list_json_files(_path)
                 if len(available_files) == 0:
                     break
                 path = self.frontend.prompt_pick(
@@ -132,11 +132,13 @@ class XmlRpcServer:
         try:
             proc = subprocess.run(cmd_args, capture_output=True, text=True, check=True)
             returncode = self._normalize_returncode(proc.returncode)
-            logger.debug(
-                "Command completed successfully. Return code: %s, stdout: %s",
-                returncode,
-                proc.stdout[:200] + "..." if len(proc.stdout) > 200 else proc.stdout,
-            )
+            # Only build the truncated stdout preview when it will actually be logged
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Command completed successfully. Return code: %s, stdout: %s",
+                    returncode,
+                    proc.stdout[:200] + "..." if len(proc.stdout) > 200 else proc.stdout,
+                )
             return {"stdout": proc.stdout, "stderr": proc.stderr, "returncode": returncode}
         except subprocess.CalledProcessError as e:
             returncode = self._normalize_returncode(e.returncode)
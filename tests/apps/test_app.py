@@ -1,4 +1,8 @@
 import asyncio
+import gc
+import json
+import sys
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -14,10 +18,11 @@ from clabe.apps import (
     Executor,
     LocalDetachedExecutor,
     PythonScriptApp,
+    StdCommand,
     identity_parser,
 )
 from clabe.apps._executors import AsyncLocalExecutor, LocalExecutor
-from clabe.apps.open_ephys import OpenEphysApp, Status, _OpenEphysGuiClient
+from clabe.apps.open_ephys import OpenEphysApp, OpenEphysAppSettings, Status, _OpenEphysGuiClient
 
 # ============================================================================
 # Test Fixtures
@@ -103,6 +108,12 @@ class TestCommandResult:
         assert result.stdout is None
         assert result.stderr is None
 
+    def test_command_result_from_trusted_matches_validated(self):
+        """Test that from_trusted builds the same result as the validated constructor."""
+        result = CommandResult.from_trusted(stdout="output", stderr="", exit_code=1)
+        assert result == CommandResult(stdout="output", stderr="", exit_code=1)
+        assert result.ok is False
+
 
 # ============================================================================
 # Command Tests
@@ -142,6 +153,19 @@ class TestCommand:
         assert result is cmd
         assert cmd.cmd == ["echo", "hello", "world"]
 
+    def test_command_uses_slots(self):
+        """Test that Command and its subclasses do not carry a per-instance __dict__."""
+        assert not hasattr(Command[CommandResult](cmd=["echo"], output_parser=identity_parser), "__dict__")
+        assert not hasattr(StdCommand(["echo"]), "__dict__")
+
+    def test_command_append_arg_does_not_mutate_input_list(self):
+        """Test that appending args leaves the list passed to the constructor untouched."""
+        base = ["echo"]
+        cmd = Command[CommandResult](cmd=base, output_parser=identity_parser)
+        cmd.append_arg("hello").append_arg("world")
+        assert base == ["echo"]
+        assert cmd.cmd == ["echo", "hello", "world"]
+
     def test_command_result_property_before_execution_raises(self):
         """Test that accessing result before execution raises RuntimeError."""
         cmd = Command[CommandResult](cmd=["echo", "hello"], output_parser=identity_parser)
@@ -348,12 +372,12 @@ class TestLocalDetachedExecutor:
         assert call_kwargs["cwd"] == tmp_path
 
     @patch("subprocess.Popen")
-    def test_defaults_cwd_to_getcwd(self, mock_popen):
-        """When cwd is omitted, cwd defaults to os.getcwd()."""
-        import os
-
+    def test_defaults_cwd_to_inherited(self, mock_popen):
+        """When cwd is omitted, Popen receives cwd=None and inherits the working directory."""
         executor = LocalDetachedExecutor()
-        assert executor.cwd == os.getcwd()
+        assert executor.cwd is None
+        executor.run(Command(cmd=["echo"], output_parser=identity_parser))
+        assert mock_popen.call_args[1]["cwd"] is None
 
     @patch("subprocess.Popen")
     def test_uses_provided_env(self, mock_popen):
@@ -472,6 +496,18 @@ class TestBonsaiApp:
                 workflow=tmp_path / "nonexistent.bonsai",
             )
 
+    def test_bonsai_app_builds_command_once_on_access(self, temp_bonsai_files):
+        """Test that the command is built lazily and reused."""
+        properties = {"param1": "value1"}
+        app = BonsaiApp(
+            executable=temp_bonsai_files["exe"],
+            workflow=temp_bonsai_files["workflow"],
+            additional_externalized_properties=properties,
+        )
+        properties["param1"] = "changed"
+        assert app.command is app.command
+        assert "-p:param1=value1" in app.command.cmd
+
     def test_bonsai_app_can_be_executed_with_mock_executor(self, temp_bonsai_files):
         """Test that BonsaiApp can be executed with a mock executor."""
         app = BonsaiApp(
@@ -702,12 +738,13 @@ class TestEdgeCases:
             cmd._set_result(result2, override=False)
 
     def test_executor_with_none_cwd(self):
-        """Test executor with None as cwd falls back to current directory."""
+        """Test executor with None as cwd lets the subprocess inherit the working directory."""
         executor = LocalExecutor(cwd=None)
-        # Should use os.getcwd() as default
-        import os
-
-        assert executor.cwd == os.getcwd()
+        assert executor.cwd is None
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(stdout="", stderr="", returncode=0)
+            executor.run(Command(cmd=[sys.executable, "-c", "pass"], output_parser=identity_parser))
+        assert mock_run.call_args[1]["cwd"] is None
 
     def test_python_script_app_with_empty_additional_arguments(self, tmp_path: Path):
         """Test PythonScriptApp filters out empty arguments."""
@@ -749,7 +786,7 @@ class TestOpenEphysGuiClient:
         assert client.base_url == "http://localhost:37497/api"
         assert client._timeout == 5.0
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get(self, mock_get: MagicMock, client: _OpenEphysGuiClient) -> None:
         """Test generic GET request."""
         mock_response = MagicMock()
@@ -763,7 +800,7 @@ class TestOpenEphysGuiClient:
         mock_get.assert_called_once_with("http://localhost:37497/api/status", timeout=5.0)
         mock_response.raise_for_status.assert_called_once()
 
-    @patch("requests.put")
+    @patch("requests.Session.put")
     def test_put(self, mock_put: MagicMock, client: _OpenEphysGuiClient) -> None:
         """Test generic PUT request with Pydantic model."""
         from clabe.apps.open_ephys import StatusRequest
@@ -780,12 +817,108 @@ class TestOpenEphysGuiClient:
         mock_put.assert_called_once()
         call_args = mock_put.call_args
         assert call_args[0][0] == "http://localhost:37497/api/status"
-        assert "json" in call_args[1]
-        assert call_args[1]["json"] == {"mode": "ACQUIRE"}
+        assert json.loads(call_args[1]["data"]) == {"mode": "ACQUIRE"}
+        assert call_args[1]["headers"] == {"Content-Type": "application/json"}
         assert call_args[1]["timeout"] == 5.0
         mock_response.raise_for_status.assert_called_once()
 
-    @patch("requests.get")
+    def test_client_reuses_session(self, client: _OpenEphysGuiClient) -> None:
+        """Test that requests from one thread share a session that close() releases."""
+        from clabe.apps.open_ephys import StatusRequest
+
+        session = client._get_session()
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"mode": "IDLE"}
+        with (
+            patch.object(session, "get", return_value=mock_response) as mock_get,
+            patch.object(session, "put", return_value=mock_response) as mock_put,
+        ):
+            client._get("/status")
+            client._put("/status", StatusRequest(mode=Status.IDLE))
+        mock_get.assert_called_once()
+        mock_put.assert_called_once()
+        assert client._get_session() is session
+
+        with patch.object(session, "close") as mock_close:
+            client.close()
+        mock_close.assert_called_once()
+        assert client._get_session() is not session
+
+    def test_client_closes_sessions_of_every_thread(self) -> None:
+        """Test that leaving the client's context closes the sessions opened by all threads."""
+        with patch("requests.Session.close", autospec=True) as mock_close:
+            with _OpenEphysGuiClient() as client:
+                sessions = [client._get_session()]
+                worker = threading.Thread(target=lambda: sessions.append(client._get_session()))
+                worker.start()
+                worker.join()
+                assert sessions[0] is not sessions[1]
+                mock_close.assert_not_called()
+        assert {call.args[0] for call in mock_close.call_args_list} == set(sessions)
+
+    def test_client_closes_sessions_when_collected(self) -> None:
+        """Test that sessions of a client that was never closed are released on garbage collection."""
+        client = _OpenEphysGuiClient()
+        session = client._get_session()
+        with patch.object(session, "close") as mock_close:
+            del client
+            gc.collect()
+        mock_close.assert_called_once()
+
+    def test_open_ephys_app_closes_client(self, tmp_path: Path) -> None:
+        """Test that leaving the app's context closes its GUI client."""
+        settings = OpenEphysAppSettings(signal_chain=tmp_path / "chain.xml", executable=tmp_path / "oe.exe")
+        with patch.object(_OpenEphysGuiClient, "close") as mock_close:
+            with OpenEphysApp(settings, skip_validation=True):
+                mock_close.assert_not_called()
+        mock_close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_requests_do_not_block(self, client: _OpenEphysGuiClient) -> None:
+        """Test that the async variants return the same parsed responses."""
+        status = MagicMock()
+        status.json.return_value = {"mode": "ACQUIRE"}
+        message = MagicMock()
+        message.json.return_value = {"message": "ok"}
+        with (
+            patch("requests.Session.get", return_value=status),
+            patch("requests.Session.put", return_value=message) as mock_put,
+        ):
+            mode, response = await asyncio.gather(client.get_status_async(), client.broadcast_message_async("hi"))
+        assert mode == Status.ACQUIRE
+        assert response == {"message": "ok"}
+        assert json.loads(mock_put.call_args[1]["data"]) == {"text": "hi"}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_async_requests_use_one_session_per_thread(self, client: _OpenEphysGuiClient) -> None:
+        """Test that concurrent async calls never share a session between threads."""
+        threads_by_session: dict[int, set[int]] = {}
+        barrier = threading.Barrier(4, timeout=5)
+
+        def _get(session, url, timeout):
+            threads_by_session.setdefault(id(session), set()).add(threading.get_ident())
+            barrier.wait()  # keep the four requests in flight at the same time
+            response = MagicMock()
+            response.json.return_value = {"mode": "IDLE"}
+            return response
+
+        with patch("requests.Session.get", autospec=True, side_effect=_get):
+            modes = await asyncio.gather(*(client.get_status_async() for _ in range(4)))
+        client.close()
+        assert modes == [Status.IDLE] * 4
+        assert len(threads_by_session) == 4
+        assert all(len(threads) == 1 for threads in threads_by_session.values())
+
+    def test_broadcast_messages_keeps_order(self, client: _OpenEphysGuiClient) -> None:
+        """Test that batched broadcasts are sent in order over the session."""
+        response = MagicMock()
+        response.json.return_value = {}
+        with patch("requests.Session.put", return_value=response) as mock_put:
+            results = client.broadcast_messages(["a", "b", "c"])
+        assert len(results) == 3
+        assert [json.loads(call[1]["data"])["text"] for call in mock_put.call_args_list] == ["a", "b", "c"]
+
+    @patch("requests.Session.get")
     def test_get_request_exception(self, mock_get: MagicMock, client: _OpenEphysGuiClient) -> None:
         """Test GET request with request exception."""
         mock_get.side_effect = requests.RequestException("Connection error")
@@ -793,7 +926,7 @@ class TestOpenEphysGuiClient:
         with pytest.raises(requests.RequestException):
             client._get("/status")
 
-    @patch("requests.put")
+    @patch("requests.Session.put")
     def test_put_request_exception(self, mock_put: MagicMock, client: _OpenEphysGuiClient) -> None:
         """Test PUT request with request exception."""
         from clabe.apps.open_ephys import StatusRequest
@@ -63,6 +63,14 @@ def isolated_cache_manager(tmp_path, monkeypatch):
     cache_manager.CacheManager._instance = None
 
 
+@pytest.fixture(autouse=True)
+def isolated_launcher_temp_dir(tmp_path, monkeypatch):
+    """Keep launcher temp directories (and their ``launcher.log``) out of the working tree."""
+    from clabe.launcher import _base
+
+    monkeypatch.setattr(_base, "TMP_DIR", str(tmp_path / ".cache"))
+
+
 @pytest.fixture(autouse=True)
 def reset_global_frontend():
     """Clear the process-wide frontend registration after each test."""
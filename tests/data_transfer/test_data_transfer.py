@@ -120,6 +120,15 @@ class TestWatchdogDataTransferService:
         mock_check_output.return_value = "INFO: No tasks are running which match the specified criteria."
         assert not watchdog_service.is_running()
 
+    @patch("clabe.data_transfer.aind_watchdog.subprocess.Popen")
+    def test_force_restart_launches_without_shell(self, mock_popen, watchdog_service):
+        watchdog_service.force_restart(kill_if_running=False)
+        mock_popen.assert_called_once_with(
+            [str(watchdog_service.executable_path), "-c", str(watchdog_service.config_path)],
+            start_new_session=True,
+            shell=False,
+        )
+
     @patch("clabe.data_transfer.aind_watchdog.requests.get")
     def test_get_project_names(self, mock_get, watchdog_service):
         mock_response = MagicMock()
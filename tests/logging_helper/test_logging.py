@@ -1,10 +1,18 @@
+import datetime
 import logging
+import logging.handlers
+import pickle
+import socket
+import sys
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from clabe.logging_helper import add_file_handler, aibs
+from clabe.logging_helper import add_file_handler, aibs, close_file_handlers, configure_levels, rich_handler
+from clabe.logging_helper._stdlib import DEFAULT_LOG_BUFFER_SIZE, _BufferedFileHandler, utc_formatter
 
 
 @pytest.fixture
@@ -27,7 +35,7 @@ def settings():
 
 
 class TestLoggingHelper:
-    @patch("logging.FileHandler")
+    @patch("clabe.logging_helper._stdlib._BufferedFileHandler")
     def test_default_logger_builder_with_output_path(self, mock_file_handler, logger):
         mock_file_handler_instance = MagicMock()
         mock_file_handler.return_value = mock_file_handler_instance
@@ -36,8 +44,134 @@ class TestLoggingHelper:
         result_logger = add_file_handler(logger, output_path)
 
         assert len(result_logger.handlers) == 1
-        assert result_logger.handlers[0] == mock_file_handler_instance
-        mock_file_handler.assert_called_once_with(output_path, encoding="utf-8", mode="w")
+        queued_handler = result_logger.handlers[0]
+        assert isinstance(queued_handler, logging.handlers.QueueHandler)
+        assert queued_handler.file_handler == mock_file_handler_instance
+        mock_file_handler.assert_called_once_with(
+            output_path, encoding="utf-8", mode="w", buffer_size=DEFAULT_LOG_BUFFER_SIZE
+        )
+        queued_handler.close()
+
+    def test_file_handler_writes_from_queue(self, logger, tmp_path):
+        output_path = tmp_path / "queued.log"
+        add_file_handler(logger, output_path)
+
+        # Logging is disabled for the test session, so hand the record to the logger directly
+        logger.handle(logger.makeRecord(logger.name, logging.INFO, __file__, 0, "queued message", None, None))
+        close_file_handlers(logger)
+
+        assert "queued message" in output_path.read_text(encoding="utf-8")
+
+    def test_file_handler_drops_records_after_close(self, logger, tmp_path):
+        add_file_handler(logger, tmp_path / "closed.log")
+        handler = logger.handlers[0]
+        close_file_handlers(logger)
+        assert logger.handlers == []
+
+        handler.handle(logger.makeRecord(logger.name, logging.INFO, __file__, 0, "late message", None, None))
+        assert handler.queue.empty()
+
+    def test_file_handler_is_reused_for_same_path(self, tmp_path):
+        first_logger = logging.getLogger("test_logger.first")
+        second_logger = logging.getLogger("test_logger.second")
+        output_path = tmp_path / "shared.log"
+        try:
+            add_file_handler(first_logger, output_path)
+            add_file_handler(second_logger, output_path)
+            shared_handler = first_logger.handlers[-1]
+            assert shared_handler is second_logger.handlers[-1]
+
+            close_file_handlers(first_logger)
+            assert first_logger.handlers == []
+            record = second_logger.makeRecord(second_logger.name, logging.INFO, __file__, 0, "still open", None, None)
+            second_logger.handle(record)
+
+            close_file_handlers(second_logger)
+            assert "still open" in output_path.read_text(encoding="utf-8")
+            add_file_handler(second_logger, output_path)
+            assert second_logger.handlers[-1] is not shared_handler
+        finally:
+            close_file_handlers(second_logger)
+            first_logger.handlers = []
+            second_logger.handlers = []
+
+    def test_buffered_file_handler_flushes_on_error(self, tmp_path):
+        output_path = tmp_path / "buffered.log"
+        handler = _BufferedFileHandler(output_path, encoding="utf-8", mode="w")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        try:
+            handler.handle(logging.makeLogRecord({"msg": "buffered", "levelno": logging.INFO}))
+            assert output_path.read_text(encoding="utf-8") == ""
+
+            handler.handle(logging.makeLogRecord({"msg": "failed", "levelno": logging.ERROR}))
+            assert output_path.read_text(encoding="utf-8") == "buffered\nfailed\n"
+        finally:
+            handler.close()
+
+    def test_utc_formatter_time_matches_format_datetime(self):
+        from aind_behavior_services.utils import format_datetime
+
+        record = logging.makeLogRecord({"created": 1700000000.75})
+        expected = format_datetime(datetime.datetime.fromtimestamp(1700000000.75, tz=datetime.timezone.utc))
+        assert utc_formatter.formatTime(record) == expected
+        assert utc_formatter.formatTime(record) == expected
+
+    def test_configure_levels(self, logger, settings, tmp_path):
+        add_file_handler(logger, tmp_path / "levels.log")
+        socket_handler = aibs.AibsLogServerHandler(settings=settings)
+        logger.addHandler(socket_handler)
+        logger.propagate = False  # the test runner attaches level-less handlers to the root logger
+        previous_console_level = rich_handler.level
+        try:
+            configure_levels(logger, console=logging.WARNING, file=logging.INFO, socket=logging.ERROR)
+
+            assert rich_handler.level == logging.WARNING
+            assert logger.handlers[0].level == logging.INFO
+            assert socket_handler.level == logging.ERROR
+            assert logger.level == logging.INFO
+        finally:
+            rich_handler.setLevel(previous_console_level)
+            close_file_handlers(logger)
+            socket_handler.close()
+            logger.propagate = True
+
+    def test_configure_levels_keeps_unspecified_handler_levels(self, logger, tmp_path):
+        output_path = tmp_path / "levels.log"
+        add_file_handler(logger, output_path)
+        logger.propagate = False
+        previous_console_level = rich_handler.level
+        try:
+            configure_levels(logger, file=logging.INFO)
+            configure_levels(logger, console=logging.ERROR)
+            assert logger.level == logging.INFO
+
+            logger.handle(logger.makeRecord(logger.name, logging.INFO, __file__, 0, "file only", None, None))
+            close_file_handlers(logger)
+            assert "file only" in output_path.read_text(encoding="utf-8")
+        finally:
+            rich_handler.setLevel(previous_console_level)
+            close_file_handlers(logger)
+            logger.propagate = True
+
+    def test_configure_levels_accounts_for_parent_handlers(self, tmp_path):
+        parent = logging.getLogger("test_logger_parent")
+        child = logging.getLogger("test_logger_parent.child")
+        parent_handler = logging.NullHandler()
+        parent_handler.setLevel(logging.DEBUG)
+        parent.addHandler(parent_handler)
+        parent.propagate = False
+        add_file_handler(child, tmp_path / "child.log")
+        try:
+            configure_levels(child, file=logging.ERROR)
+            assert child.level == logging.DEBUG
+        finally:
+            close_file_handlers(child)
+            parent.removeHandler(parent_handler)
+            parent.propagate = True
+
+    def test_utc_formatter_honors_datefmt(self):
+        record = logging.makeLogRecord({"created": 1700000000.75})
+        assert utc_formatter.formatTime(record, "%Y-%m-%d %H:%M:%S") == "2023-11-14 22:13:20"
 
     @patch("clabe.logging_helper.aibs.AibsLogServerHandler")
     def test_add_log_server_handler(self, mock_log_server_handler, logger, settings):
@@ -49,3 +183,97 @@ class TestLoggingHelper:
         assert len(result_logger.handlers) == 1
         assert result_logger.handlers[0] == mock_log_server_handler_instance
         mock_log_server_handler.assert_called_once_with(settings=settings)
+
+    def test_log_server_handler_batches_records(self, settings):
+        handler = aibs.AibsLogServerHandler(settings=settings, flush_interval=60)
+        handler.send = MagicMock()
+        records = [logging.makeLogRecord({"msg": f"error {i}", "levelno": logging.ERROR}) for i in range(3)]
+        try:
+            for record in records:
+                handler.handle(record)
+            handler.send.assert_not_called()
+
+            handler.flush()
+            handler.send.assert_called_once_with(b"".join(handler.makePickle(r) for r in records))
+        finally:
+            handler.close()
+
+    def test_log_server_handler_sends_when_batch_is_full(self, settings):
+        handler = aibs.AibsLogServerHandler(settings=settings, batch_size=1, flush_interval=60)
+        handler.send = MagicMock()
+        try:
+            handler.handle(logging.makeLogRecord({"msg": "error", "levelno": logging.ERROR}))
+            handler.flush()
+            handler.send.assert_called_once()
+        finally:
+            handler.close()
+
+    def test_log_server_handler_drops_records_when_queue_is_full(self, settings):
+        sending = threading.Event()
+        release = threading.Event()
+
+        def _blocking_send(data):
+            sending.set()
+            release.wait(5)
+
+        handler = aibs.AibsLogServerHandler(settings=settings, batch_size=1, max_queue_size=1)
+        handler.send = _blocking_send
+        try:
+            handler.handle(logging.makeLogRecord({"msg": "sending", "levelno": logging.ERROR}))
+            assert sending.wait(5)
+            handler.handle(logging.makeLogRecord({"msg": "queued", "levelno": logging.ERROR}))
+            handler.handle(logging.makeLogRecord({"msg": "dropped", "levelno": logging.ERROR}))
+            assert handler.dropped_records == 1
+        finally:
+            release.set()
+            handler.close()
+
+    def test_log_server_handler_flush_and_close_are_bounded(self, settings):
+        settings.host, settings.port = "10.255.255.1", 9  # non-routable
+        handler = aibs.AibsLogServerHandler(settings=settings, close_timeout=0.2, flush_interval=0)
+
+        def _unreachable(timeout=1):
+            # Some sandboxes reject the address immediately, so emulate a connect that hangs until it times out
+            time.sleep(timeout)
+            raise OSError("host unreachable")
+
+        handler.makeSocket = _unreachable
+        try:
+            handler.handle(logging.makeLogRecord({"msg": "unsent", "levelno": logging.ERROR}))
+            start = time.monotonic()
+            handler.flush()
+            assert time.monotonic() - start < 0.5
+        finally:
+            start = time.monotonic()
+            handler.close()
+            assert time.monotonic() - start < 0.5
+
+    def test_log_server_handler_reuses_resolved_address(self, settings):
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            settings.host, settings.port = server.getsockname()
+            handler = aibs.AibsLogServerHandler(settings=settings)
+            try:
+                with patch("socket.getaddrinfo", wraps=socket.getaddrinfo) as mock_getaddrinfo:
+                    handler.makeSocket().close()
+                    handler.makeSocket().close()
+                mock_getaddrinfo.assert_called_once()
+            finally:
+                handler.close()
+
+    def test_log_server_handler_pickle_matches_socket_handler(self, settings):
+        handler = aibs.AibsLogServerHandler(settings=settings)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            exc_info = sys.exc_info()
+        try:
+            record = logging.LogRecord("test", logging.ERROR, __file__, 10, "failed %s", ("here",), exc_info, "func")
+            expected = logging.handlers.SocketHandler.makePickle(handler, logging.makeLogRecord(record.__dict__))
+            expected_fields = pickle.loads(expected[4:])
+            expected_fields.pop("asctime")  # only set as a side effect of formatting the whole record
+            expected_fields.update(project="test_project", rig_id="test_rig", comp_id="test_comp", version="0.1.0")
+            expected_fields["extra"] = None
+            assert pickle.loads(handler.makePickle(record)[4:]) == expected_fields
+            assert not hasattr(record, "project")
+        finally:
+            handler.close()
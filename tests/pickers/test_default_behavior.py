@@ -0,0 +1,18 @@
+import glob
+import os
+from pathlib import Path
+
+from clabe.pickers.default_behavior import _list_json_files
+
+
+class TestListJsonFiles:
+    def test_matches_glob(self, tmp_path: Path):
+        for name in ["rig1.json", "rig2.json", "notes.txt", ".hidden.json"]:
+            (tmp_path / name).touch()
+        (tmp_path / "folder.json").mkdir()
+        expected = [p for p in glob.glob(os.path.join(tmp_path, "*.json")) if os.path.isfile(p)]
+        assert sorted(_list_json_files(tmp_path)) == sorted(expected)
+        assert sorted(os.path.basename(p) for p in _list_json_files(tmp_path)) == ["rig1.json", "rig2.json"]
+
+    def test_missing_directory(self, tmp_path: Path):
+        assert _list_json_files(tmp_path / "missing") == []